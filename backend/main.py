@@ -1,17 +1,25 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, Request, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-import json
+from fastapi.responses import ORJSONResponse, Response
+import asyncio
+import bisect
+import functools
 import math
-from typing import Dict, Any, Tuple, Optional
+import re
+import sys
+import orjson
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, List, Tuple, Optional
 import io
 
-app = FastAPI(title="ABOM Risk Scoring Engine")
+# Serialize all responses with orjson instead of stdlib json
+app = FastAPI(title="ABOM Risk Scoring Engine", default_response_class=ORJSONResponse)
 
-# Enable CORS for frontend
+# Enable CORS for frontend; a compiled origin regex avoids the
+# per-request linear scan of an allow_origins list
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:5173"],
+    allow_origin_regex=r"^http://localhost:(3000|5173)$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -20,6 +28,18 @@ app.add_middleware(
 # Tier 4 threshold per EU AI Act (10^25 FLOPs)
 SYSTEMIC_RISK_FLOPS_THRESHOLD = 1e25
 
+# Hard cap on ABOM upload size; oversized bodies are rejected before parsing
+MAX_UPLOAD_BYTES = 2 * 1024 * 1024  # 2 MiB
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Payloads above this size are parsed/scored in a worker thread so they
+# do not block the event loop; smaller ones stay inline to avoid the
+# thread-hop overhead
+_OFFLOAD_THRESHOLD_BYTES = 256 * 1024
+
+# Batches larger than this are scored in a worker thread
+_BATCH_OFFLOAD_THRESHOLD = 32
+
 # Capability flags that automatically trigger Tier 4
 TIER_4_CAPABILITY_FLAGS = [
     "self-replication", "self_replication", "autonomous_replication",
@@ -27,10 +47,44 @@ TIER_4_CAPABILITY_FLAGS = [
     "autonomous_weapons", "critical_infrastructure_control"
 ]
 
+# ABOM keys used on the scoring hot path, interned once so every dict
+# lookup starts with a pointer-identity compare instead of a memcmp
+_K_MODEL_CORE = sys.intern("model_core")
+_K_AGENCY_PROFILE = sys.intern("agency_profile")
+_K_AUTONOMY_LEASH = sys.intern("autonomy_leash")
+_K_PERSISTENCE_LAYER = sys.intern("persistence_layer")
+_K_SCAFFOLDING = sys.intern("scaffolding_inventory")
+_K_TRAINING_FLOPS = sys.intern("training_flops")
+_K_FLOPS = sys.intern("flops")
+_K_TOOLS = sys.intern("tools")
+_K_CAPABILITY_FLAGS = sys.intern("capability_flags")
+_K_NAME = sys.intern("name")
+_K_PERMISSION = sys.intern("permission")
+_K_SCOPE = sys.intern("scope")
+_K_MODE = sys.intern("mode")
+_K_MEMORY_TYPE = sys.intern("memory_type")
+_K_RETENTION = sys.intern("retention")
+
+# Permissions that mark a tool as state-changing (O(1) set membership)
+_STATE_CHANGING_PERMS = frozenset({"write", "exec", "delete", "modify", "create", "update", "remove"})
+
+# Keyword patterns compiled once so each tool name is scanned in a
+# single pass instead of one substring search per keyword
+_STATE_CHANGING_RE = re.compile(r"write|exec|delete|modify|create|update|remove")
+_CRITICAL_RE = re.compile(r"replicat|cbrn|bioweapon|nuclear|weapon|critical_infra")
+
+# Tier 4 flag lookups precomputed once: a frozenset for exact matches on
+# capability_flags, and a separator-stripped alternation for scanning
+# tool names in a single pass
+_TIER_4_FLAG_SET = frozenset(TIER_4_CAPABILITY_FLAGS)
+_TIER_4_RE = re.compile("|".join(
+    re.escape(flag.replace("_", "").replace("-", "")) for flag in TIER_4_CAPABILITY_FLAGS
+))
+
 
 def extract_flops(model_core: Dict[str, Any]) -> Optional[float]:
     """Extract training FLOPs from model_core section."""
-    flops = model_core.get("training_flops") or model_core.get("flops")
+    flops = model_core.get(_K_TRAINING_FLOPS) or model_core.get(_K_FLOPS)
     if flops is None:
         return None
     
@@ -45,25 +99,24 @@ def extract_flops(model_core: Dict[str, Any]) -> Optional[float]:
 
 def check_tier4_capability_flags(agency_profile: Dict[str, Any]) -> bool:
     """Check if any capability flags automatically trigger Tier 4."""
-    capability_flags = agency_profile.get("capability_flags", [])
+    capability_flags = agency_profile.get(_K_CAPABILITY_FLAGS, [])
     if isinstance(capability_flags, list):
         for flag in capability_flags:
-            if isinstance(flag, str) and flag.lower() in TIER_4_CAPABILITY_FLAGS:
+            if isinstance(flag, str) and flag.lower() in _TIER_4_FLAG_SET:
                 return True
-    
+
     # Also check tools for dangerous capabilities
-    tools = agency_profile.get("tools", [])
+    tools = agency_profile.get(_K_TOOLS, [])
     for tool in tools:
         tool_name = ""
         if isinstance(tool, dict):
-            tool_name = tool.get("name", "").lower()
+            tool_name = tool.get(_K_NAME, "").lower()
         elif isinstance(tool, str):
             tool_name = tool.lower()
-        
-        for flag in TIER_4_CAPABILITY_FLAGS:
-            if flag.replace("_", "").replace("-", "") in tool_name.replace("_", "").replace("-", ""):
-                return True
-    
+
+        if _TIER_4_RE.search(tool_name.replace("_", "").replace("-", "")):
+            return True
+
     return False
 
 
@@ -76,7 +129,7 @@ def calculate_agency_score(agency_profile: Dict[str, Any]) -> int:
     - 4: State-changing tools
     - 6: Critical/dangerous capabilities (CBRN, self-replication)
     """
-    tools = agency_profile.get("tools", [])
+    tools = agency_profile.get(_K_TOOLS, [])
     
     if not tools or len(tools) == 0:
         return 1  # No tools
@@ -84,29 +137,32 @@ def calculate_agency_score(agency_profile: Dict[str, Any]) -> int:
     has_state_changing = False
     has_critical_capability = False
     
+    # Bind the compiled matchers once for the loop
+    state_changing_search = _STATE_CHANGING_RE.search
+    critical_search = _CRITICAL_RE.search
+
     # Handle both formats: array of strings or array of objects
     for tool in tools:
         tool_name = ""
-        permission = ""
-        
+
         if isinstance(tool, dict):
-            tool_name = tool.get("name", "").lower()
-            permission = tool.get("permission", "").lower()
-            if permission in ["write", "exec", "delete", "modify", "create", "update", "remove"]:
+            tool_name = tool.get(_K_NAME, "").lower()
+            permission = tool.get(_K_PERMISSION, "").lower()
+            if permission in _STATE_CHANGING_PERMS:
                 has_state_changing = True
         elif isinstance(tool, str):
             tool_name = tool.lower()
-            state_changing_keywords = ["write", "exec", "delete", "modify", "create", "update", "remove"]
-            if any(keyword in tool_name for keyword in state_changing_keywords):
+            if state_changing_search(tool_name):
                 has_state_changing = True
-        
-        # Check for critical capabilities
-        critical_keywords = ["replicat", "cbrn", "bioweapon", "nuclear", "weapon", "critical_infra"]
-        if any(keyword in tool_name for keyword in critical_keywords):
+
+        # Check for critical capabilities; 6 is the maximum score, so
+        # stop scanning as soon as one is found
+        if tool_name and critical_search(tool_name):
             has_critical_capability = True
+            break
     
     # Also check scope field
-    scope = agency_profile.get("scope", "").lower()
+    scope = agency_profile.get(_K_SCOPE, "").lower()
     if "state-changing" in scope or "state changing" in scope:
         has_state_changing = True
     if "critical" in scope or "dangerous" in scope:
@@ -124,7 +180,7 @@ def calculate_autonomy_score(autonomy_leash: Any) -> int:
     """Calculate autonomy score based on leash type."""
     # Handle both formats: string or object with "mode" field
     if isinstance(autonomy_leash, dict):
-        leash = autonomy_leash.get("mode", "").upper()
+        leash = autonomy_leash.get(_K_MODE, "").upper()
     elif isinstance(autonomy_leash, str):
         leash = autonomy_leash.upper()
     else:
@@ -141,31 +197,35 @@ def calculate_autonomy_score(autonomy_leash: Any) -> int:
         return 1
 
 
+# Lookup tables for persistence scoring: a single dict probe replaces
+# the chain of list-membership tests previously run per request
+_NO_PERSISTENCE_TYPES = frozenset({"", "none", "ephemeral", "temporary"})
+_RETENTION_SCORES = {
+    "session": 1, "session-only": 1, "temporary": 1, "short": 1,
+    "cross-session": 2, "cross_session": 2, "long-term": 2, "long_term": 2,
+    "long": 2, "permanent": 2,
+}
+_MEMORY_TYPE_SCORES = {
+    "long-term": 2, "long_term": 2, "long": 2, "persistent": 2,
+    "vector-db": 2, "vector_db": 2, "session": 1,
+}
+
+
 def calculate_persistence_score(persistence_layer: Dict[str, Any]) -> int:
     """Calculate persistence score based on memory type and retention."""
-    memory_type = persistence_layer.get("memory_type", "").lower()
-    retention = persistence_layer.get("retention", "").lower()
-    
+    memory_type = persistence_layer.get(_K_MEMORY_TYPE, "").lower()
+
     # Check for no persistence
-    if not memory_type or memory_type in ["none", "ephemeral", "temporary"]:
-        return 0
-    
-    # Check for session-only
-    if retention in ["session", "session-only", "temporary", "short"]:
-        return 1
-    
-    # Check for cross-session or long-term
-    if retention in ["cross-session", "cross_session", "long-term", "long_term", "long", "permanent"]:
-        return 2
-    
-    # Default based on memory_type
-    if memory_type in ["long-term", "long_term", "long", "persistent", "vector-db", "vector_db"]:
-        return 2
-    elif memory_type in ["session", "temporary", "ephemeral"]:
-        return 1
-    else:
+    if memory_type in _NO_PERSISTENCE_TYPES:
         return 0
 
+    # Retention takes precedence, then fall back to memory_type
+    score = _RETENTION_SCORES.get(persistence_layer.get(_K_RETENTION, "").lower())
+    if score is not None:
+        return score
+
+    return _MEMORY_TYPE_SCORES.get(memory_type, 0)
+
 
 def calculate_scaffolding_modifier(scaffolding: Dict[str, Any]) -> float:
     """
@@ -194,12 +254,22 @@ def calculate_scaffolding_modifier(scaffolding: Dict[str, Any]) -> float:
     return max(modifier, 0.7)
 
 
+# e^P for P in {0, 1, 2} — persistence is clamped to this range by
+# calculate_persistence_score, so a tuple lookup beats math.exp per call
+_EXP_TABLE = (math.exp(0), math.exp(1), math.exp(2))
+
+
 def calculate_risk_score(agency: int, autonomy: int, persistence: int, scaffolding_modifier: float = 1.0) -> float:
     """Calculate risk score: R = A × U × e^P × scaffolding_modifier"""
-    base_score = agency * autonomy * math.exp(persistence)
+    assert 0 <= persistence <= 2
+    base_score = agency * autonomy * _EXP_TABLE[persistence]
     return base_score * scaffolding_modifier
 
 
+# Tier boundaries (inclusive lower bounds for Tiers 2-4)
+_TIER_THRESHOLDS = (5.0, 20.0, 50.0)
+
+
 def determine_uart_tier(risk_score: float) -> int:
     """
     Determine UART tier based on risk score.
@@ -207,155 +277,221 @@ def determine_uart_tier(risk_score: float) -> int:
     """
     if risk_score == 0:
         return 0
-    elif risk_score < 5:
-        return 1
-    elif risk_score < 20:
-        return 2
-    elif risk_score < 50:
-        return 3
-    else:
-        return 4
+    return bisect.bisect_right(_TIER_THRESHOLDS, risk_score) + 1
+
+
+@dataclass(slots=True)
+class Assessment:
+    """
+    Scoring result for one ABOM. A slots dataclass avoids the per-request
+    dict allocation, and orjson serializes dataclasses natively so no
+    conversion is needed on the response path.
+    """
+    agency: int
+    autonomy: int
+    persistence: int
+    scaffolding_modifier: float
+    score: float
+    tier: int
+    tier_4_overrides: Optional[List[str]]
+
+
+def _check_content_length(request: Request) -> None:
+    """Reject oversized requests from the Content-Length header before reading the body."""
+    content_length = request.headers.get("content-length")
+    # Allow some headroom over the file cap for multipart framing
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES + 16 * 1024:
+        raise HTTPException(status_code=413, detail="Uploaded file exceeds maximum size of 2 MiB")
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an upload in bounded chunks, bailing out once it exceeds the size cap."""
+    chunks = []
+    total = 0
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Uploaded file exceeds maximum size of 2 MiB")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _compute_assessment(
+    abom_data: Dict[str, Any],
+    *,
+    # The scoring pipeline is fixed, so specialize it at definition time:
+    # keyword-only defaults bind each stage as a local (LOAD_FAST) rather
+    # than resolving a global name on every call
+    _agency_score=calculate_agency_score,
+    _autonomy_score=calculate_autonomy_score,
+    _persistence_score=calculate_persistence_score,
+    _scaffolding_modifier=calculate_scaffolding_modifier,
+    _risk_score=calculate_risk_score,
+    _uart_tier=determine_uart_tier,
+    _flops=extract_flops,
+    _tier4_flags=check_tier4_capability_flags,
+) -> Assessment:
+    """Run the extract/validate/score/tier pipeline on a parsed ABOM."""
+    # Extract required fields
+    model_core = abom_data.get(_K_MODEL_CORE, {})
+    agency_profile = abom_data.get(_K_AGENCY_PROFILE, {})
+    autonomy_leash = abom_data.get(_K_AUTONOMY_LEASH, "")
+    persistence_layer = abom_data.get(_K_PERSISTENCE_LAYER, {})
+    scaffolding = abom_data.get(_K_SCAFFOLDING, {})
+
+    # Validate required fields
+    if not agency_profile:
+        raise HTTPException(status_code=400, detail="Missing 'agency_profile' field")
+    if autonomy_leash is None or (isinstance(autonomy_leash, str) and not autonomy_leash):
+        raise HTTPException(status_code=400, detail="Missing 'autonomy_leash' field")
+    if not persistence_layer:
+        raise HTTPException(status_code=400, detail="Missing 'persistence_layer' field")
+
+    # Calculate scores
+    agency = _agency_score(agency_profile)
+    autonomy = _autonomy_score(autonomy_leash)
+    persistence = _persistence_score(persistence_layer)
+    scaffolding_mod = _scaffolding_modifier(scaffolding)
+
+    # Calculate risk score with scaffolding modifier
+    risk_score = _risk_score(agency, autonomy, persistence, scaffolding_mod)
+
+    # Determine tier (before overrides)
+    tier = _uart_tier(risk_score)
+
+    # Check for Tier 4 overrides
+    tier_4_reasons = []
+
+    # Check FLOPs threshold (EU AI Act systemic risk: ≥10^25)
+    flops = _flops(model_core)
+    if flops is not None and flops >= SYSTEMIC_RISK_FLOPS_THRESHOLD:
+        tier = 4
+        tier_4_reasons.append(f"Training FLOPs ({flops:.2e}) exceeds systemic risk threshold (1e25)")
+
+    # Check capability flags
+    if _tier4_flags(agency_profile):
+        tier = 4
+        tier_4_reasons.append("Contains Tier 4 capability flags (e.g., self-replication, CBRN)")
+
+    return Assessment(
+        agency=agency,
+        autonomy=autonomy,
+        persistence=persistence,
+        scaffolding_modifier=round(scaffolding_mod, 3),
+        score=round(risk_score, 2),
+        tier=tier,
+        tier_4_overrides=tier_4_reasons if tier_4_reasons else None,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _score_from_bytes(contents: bytes) -> Tuple[Dict[str, Any], Assessment]:
+    """
+    Parse raw ABOM bytes and run the full scoring pipeline.
+    Returns (abom_data, result). Memoized on the upload bytes so scoring
+    the same ABOM again (e.g. calculate-risk followed by download-report
+    from the UI) is a cache hit instead of a full re-parse and re-score.
+    """
+    # Cheap prefilter: an ABOM document must start with { or [, so reject
+    # obviously non-JSON uploads (zip magic, empty body, plain text)
+    # without paying for a full parse attempt
+    stripped = contents.lstrip()
+    if not stripped or stripped[:1] not in b"{[":
+        raise HTTPException(status_code=400, detail="Invalid JSON format: not a JSON object or array")
+
+    # Parse JSON (orjson accepts bytes directly, no decode needed)
+    try:
+        abom_data = orjson.loads(stripped)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
+
+    return abom_data, _compute_assessment(abom_data)
+
+
+async def _score_upload(contents: bytes) -> Tuple[Dict[str, Any], Assessment]:
+    """Score upload bytes, offloading large payloads to a worker thread."""
+    if len(contents) > _OFFLOAD_THRESHOLD_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(None, _score_from_bytes, contents)
+    return _score_from_bytes(contents)
 
 
 @app.post("/api/calculate-risk")
-async def calculate_risk(file: UploadFile = File(...)):
+async def calculate_risk(request: Request, file: UploadFile = File(...)):
     """Calculate risk score from uploaded ABOM JSON file."""
     try:
-        # Read file content
-        contents = await file.read()
-        
-        # Parse JSON
+        # Read file content, rejecting oversized uploads early
+        _check_content_length(request)
+        contents = await _read_upload(file)
+
+        _, result = await _score_upload(contents)
+
+        # Hand the dataclass straight to orjson; no dict conversion needed
+        return ORJSONResponse(result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+@app.post("/api/calculate-risk-batch")
+async def calculate_risk_batch(request: Request):
+    """
+    Calculate risk scores for a JSON array of ABOMs in a single request.
+    Amortizes the per-request HTTP and parse overhead when scoring many
+    agents at once (e.g. a fleet-wide scan from the UI).
+    """
+    try:
+        _check_content_length(request)
+        body = await request.body()
+
+        # Parse the whole batch once
         try:
-            abom_data = json.loads(contents.decode('utf-8'))
-        except json.JSONDecodeError as e:
+            aboms = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
-        
-        # Extract required fields
-        model_core = abom_data.get("model_core", {})
-        agency_profile = abom_data.get("agency_profile", {})
-        autonomy_leash = abom_data.get("autonomy_leash", "")
-        persistence_layer = abom_data.get("persistence_layer", {})
-        scaffolding = abom_data.get("scaffolding_inventory", {})
-        
-        # Validate required fields
-        if not agency_profile:
-            raise HTTPException(status_code=400, detail="Missing 'agency_profile' field")
-        if autonomy_leash is None or (isinstance(autonomy_leash, str) and not autonomy_leash):
-            raise HTTPException(status_code=400, detail="Missing 'autonomy_leash' field")
-        if not persistence_layer:
-            raise HTTPException(status_code=400, detail="Missing 'persistence_layer' field")
-        
-        # Calculate scores
-        agency = calculate_agency_score(agency_profile)
-        autonomy = calculate_autonomy_score(autonomy_leash)
-        persistence = calculate_persistence_score(persistence_layer)
-        scaffolding_mod = calculate_scaffolding_modifier(scaffolding)
-        
-        # Calculate risk score with scaffolding modifier
-        risk_score = calculate_risk_score(agency, autonomy, persistence, scaffolding_mod)
-        
-        # Determine tier (before overrides)
-        tier = determine_uart_tier(risk_score)
-        
-        # Check for Tier 4 overrides
-        tier_4_reasons = []
-        
-        # Check FLOPs threshold (EU AI Act systemic risk: ≥10^25)
-        flops = extract_flops(model_core)
-        if flops is not None and flops >= SYSTEMIC_RISK_FLOPS_THRESHOLD:
-            tier = 4
-            tier_4_reasons.append(f"Training FLOPs ({flops:.2e}) exceeds systemic risk threshold (1e25)")
-        
-        # Check capability flags
-        if check_tier4_capability_flags(agency_profile):
-            tier = 4
-            tier_4_reasons.append("Contains Tier 4 capability flags (e.g., self-replication, CBRN)")
-        
-        # Prepare response
-        result = {
-            "agency": agency,
-            "autonomy": autonomy,
-            "persistence": persistence,
-            "scaffolding_modifier": round(scaffolding_mod, 3),
-            "score": round(risk_score, 2),
-            "tier": tier,
-            "tier_4_overrides": tier_4_reasons if tier_4_reasons else None
-        }
-        
-        return JSONResponse(content=result)
-    
+
+        if not isinstance(aboms, list):
+            raise HTTPException(status_code=400, detail="Batch payload must be a JSON array of ABOM objects")
+        for index, abom in enumerate(aboms):
+            if not isinstance(abom, dict):
+                raise HTTPException(status_code=400, detail=f"Batch item {index} is not an ABOM object")
+
+        # Score inline for small batches; offload large ones so they do
+        # not block the event loop
+        if len(aboms) > _BATCH_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                None, lambda: [_compute_assessment(abom) for abom in aboms]
+            )
+        else:
+            results = [_compute_assessment(abom) for abom in aboms]
+
+        return ORJSONResponse(results)
+
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing batch: {str(e)}")
 
 
 @app.post("/api/download-report")
-async def download_report(file: UploadFile = File(...)):
+async def download_report(request: Request, file: UploadFile = File(...)):
     """Generate and download risk assessment report as JSON."""
     try:
-        # Read file content
-        contents = await file.read()
-        
-        # Parse JSON
-        try:
-            abom_data = json.loads(contents.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
-        
-        # Extract required fields
-        model_core = abom_data.get("model_core", {})
-        agency_profile = abom_data.get("agency_profile", {})
-        autonomy_leash = abom_data.get("autonomy_leash", "")
-        persistence_layer = abom_data.get("persistence_layer", {})
-        scaffolding = abom_data.get("scaffolding_inventory", {})
-        
-        # Validate required fields
-        if not agency_profile:
-            raise HTTPException(status_code=400, detail="Missing 'agency_profile' field")
-        if autonomy_leash is None or (isinstance(autonomy_leash, str) and not autonomy_leash):
-            raise HTTPException(status_code=400, detail="Missing 'autonomy_leash' field")
-        if not persistence_layer:
-            raise HTTPException(status_code=400, detail="Missing 'persistence_layer' field")
-        
-        # Calculate scores
-        agency = calculate_agency_score(agency_profile)
-        autonomy = calculate_autonomy_score(autonomy_leash)
-        persistence = calculate_persistence_score(persistence_layer)
-        scaffolding_mod = calculate_scaffolding_modifier(scaffolding)
-        
-        # Calculate risk score with scaffolding modifier
-        risk_score = calculate_risk_score(agency, autonomy, persistence, scaffolding_mod)
-        
-        # Determine tier (before overrides)
-        tier = determine_uart_tier(risk_score)
-        
-        # Check for Tier 4 overrides
-        tier_4_reasons = []
-        
-        # Check FLOPs threshold
-        flops = extract_flops(model_core)
-        if flops is not None and flops >= SYSTEMIC_RISK_FLOPS_THRESHOLD:
-            tier = 4
-            tier_4_reasons.append(f"Training FLOPs ({flops:.2e}) exceeds systemic risk threshold (1e25)")
-        
-        # Check capability flags
-        if check_tier4_capability_flags(agency_profile):
-            tier = 4
-            tier_4_reasons.append("Contains Tier 4 capability flags (e.g., self-replication, CBRN)")
-        
+        # Read file content, rejecting oversized uploads early
+        _check_content_length(request)
+        contents = await _read_upload(file)
+
+        # Reuse the memoized scoring pipeline instead of rerunning it
+        abom_data, result = await _score_upload(contents)
+
         # Create comprehensive report
         report = {
             "abom_input": abom_data,
             "risk_assessment": {
-                "agency": agency,
-                "autonomy": autonomy,
-                "persistence": persistence,
-                "scaffolding_modifier": round(scaffolding_mod, 3),
-                "score": round(risk_score, 2),
-                "tier": tier,
-                "tier_description": f"UART Tier {tier}",
-                "tier_4_overrides": tier_4_reasons if tier_4_reasons else None
+                **asdict(result),
+                "tier_description": f"UART Tier {result.tier}"
             },
             "formula": "R = A × U × e^P × scaffolding_modifier",
             "tier_thresholds": {
@@ -367,13 +503,11 @@ async def download_report(file: UploadFile = File(...)):
             }
         }
         
-        # Create JSON file in memory
-        report_json = json.dumps(report, indent=2)
-        report_bytes = report_json.encode('utf-8')
-        
-        # Return as downloadable file
-        return JSONResponse(
-            content=report,
+        # Serialize once with orjson and return the bytes as a
+        # downloadable file; Starlette does not re-serialize
+        return Response(
+            content=orjson.dumps(report, option=orjson.OPT_INDENT_2),
+            media_type="application/json",
             headers={
                 "Content-Disposition": "attachment; filename=abom_risk_report.json"
             }
@@ -390,3 +524,20 @@ async def root():
     """Health check endpoint."""
     return {"message": "ABOM Risk Scoring Engine API", "status": "running"}
 
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard] and cut per-request
+    # event-loop and HTTP-parsing overhead versus the asyncio defaults
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        log_level="warning",
+    )
+
@@ -27,7 +27,7 @@ if [ ! -d "venv" ]; then
 fi
 source venv/bin/activate
 pip install -r requirements.txt -q
-uvicorn main:app --reload --port 8000 &
+uvicorn main:app --reload --port 8000 --loop uvloop --http httptools &
 BACKEND_PID=$!
 cd ..
 
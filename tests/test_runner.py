@@ -5,64 +5,83 @@ Tests all 5 test cases and validates expected results
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import functools
+import io
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 BASE_URL = "http://localhost:8000"
 TEST_DIR = Path(__file__).parent
 
+# Shared keep-alive session so all test cases reuse one pooled TCP
+# connection instead of paying a fresh connect per request
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# Full request/response dumps cost two json.dumps passes plus large
+# prints per case; opt in with ABOM_TEST_VERBOSE=1, default is a
+# one-line summary per case
+VERBOSE = os.environ.get("ABOM_TEST_VERBOSE") == "1"
+
+@dataclass(frozen=True, slots=True)
+class Expected:
+    """Expected scoring outcome for one test case."""
+    agency: int
+    autonomy: int
+    persistence: int
+    tier: int
+    score_range: tuple
+    expect_tier_4_override: bool = False
+
+
 # Expected results for each test case
 # Note: Scaffolding modifiers can reduce scores by up to 30%
 # FLOPs >= 1e25 automatically triggers Tier 4 override
 # Tier thresholds per paper: Tier 0 (R=0), Tier 1 (0<R<5), Tier 2 (5≤R<20), Tier 3 (20≤R<50), Tier 4 (R≥50)
-EXPECTED_RESULTS = {
-    "test_case_1_minimal_risk.json": {
-        "agency": 1,
-        "autonomy": 1,
-        "persistence": 0,
-        "tier": 1,  # R = 1 × 1 × e^0 × 0.85 = 0.85 → Tier 1 (0 < R < 5)
-        "score_range": (0, 5)
-    },
-    "test_case_2_low_risk.json": {
-        "agency": 2,
-        "autonomy": 2,
-        "persistence": 1,
-        "tier": 2,  # R = 2 × 2 × e^1 × 0.765 ≈ 8.32 → Tier 2 (5 ≤ R < 20)
-        "score_range": (5, 20)
-    },
-    "test_case_3_moderate_risk.json": {
-        "agency": 4,
-        "autonomy": 3,
-        "persistence": 1,
-        "tier": 3,  # R = 4 × 3 × e^1 × 0.765 ≈ 24.95 → Tier 3 (20 ≤ R < 50)
-        "score_range": (20, 50)
-    },
-    "test_case_4_high_risk.json": {
-        "agency": 4,
-        "autonomy": 3,
-        "persistence": 2,
-        "tier": 4,  # FLOPs (1.1e25) triggers Tier 4 override
-        "score_range": (50, 100),  # R = 4 × 3 × e^2 × 0.765 ≈ 67.83
-        "expect_tier_4_override": True
-    },
-    "test_case_5_critical_risk.json": {
-        "agency": 4,
-        "autonomy": 3,
-        "persistence": 2,
-        "tier": 4,  # FLOPs (2.0e25) triggers Tier 4 override
-        "score_range": (50, 100),  # R = 4 × 3 × e^2 × 0.9 ≈ 79.8
-        "expect_tier_4_override": True
-    },
-    "test_case_6_tier4_override.json": {
-        "agency": 6,  # Critical capability (self-replication)
-        "autonomy": 3,
-        "persistence": 2,
-        "tier": 4,  # FLOPs >= 1e25 AND capability flags trigger Tier 4
-        "score_range": (100, 200),  # R = 6 × 3 × e^2 × 1.0 ≈ 133.0 (no scaffolding reduction)
-        "expect_tier_4_override": True
-    }
-}
+EXPECTED_RESULTS = (
+    # R = 1 × 1 × e^0 × 0.85 = 0.85 → Tier 1 (0 < R < 5)
+    ("test_case_1_minimal_risk.json",
+     Expected(agency=1, autonomy=1, persistence=0, tier=1, score_range=(0, 5))),
+    # R = 2 × 2 × e^1 × 0.765 ≈ 8.32 → Tier 2 (5 ≤ R < 20)
+    ("test_case_2_low_risk.json",
+     Expected(agency=2, autonomy=2, persistence=1, tier=2, score_range=(5, 20))),
+    # R = 4 × 3 × e^1 × 0.765 ≈ 24.95 → Tier 3 (20 ≤ R < 50)
+    ("test_case_3_moderate_risk.json",
+     Expected(agency=4, autonomy=3, persistence=1, tier=3, score_range=(20, 50))),
+    # R = 4 × 3 × e^2 × 0.765 ≈ 67.83; FLOPs (1.1e25) triggers Tier 4 override
+    ("test_case_4_high_risk.json",
+     Expected(agency=4, autonomy=3, persistence=2, tier=4, score_range=(50, 100),
+              expect_tier_4_override=True)),
+    # R = 4 × 3 × e^2 × 0.9 ≈ 79.8; FLOPs (2.0e25) triggers Tier 4 override
+    ("test_case_5_critical_risk.json",
+     Expected(agency=4, autonomy=3, persistence=2, tier=4, score_range=(50, 100),
+              expect_tier_4_override=True)),
+    # R = 6 × 3 × e^2 × 1.0 ≈ 133.0 (critical capability, no scaffolding
+    # reduction); FLOPs >= 1e25 AND capability flags trigger Tier 4
+    ("test_case_6_tier4_override.json",
+     Expected(agency=6, autonomy=3, persistence=2, tier=4, score_range=(100, 200),
+              expect_tier_4_override=True)),
+)
+
+# Load each test payload once at import: the raw bytes for the multipart
+# upload plus the parsed dict for logging. Avoids re-opening every file
+# twice per run and keeps parallel workers off the filesystem.
+_PAYLOADS = {}
+for _name, _ in EXPECTED_RESULTS:
+    _path = TEST_DIR / _name
+    if _path.exists():
+        _raw = _path.read_bytes()
+        _PAYLOADS[_name] = (_raw, json.loads(_raw))
 
 # Let me fix test_case_3 and test_case_5
 # For tier 2 (25-50): A=4, U=3, P=1 gives 12×e^1 ≈ 32.6 ✓
@@ -70,90 +89,130 @@ EXPECTED_RESULTS = {
 # Actually, let me recalculate test_case_3 to have P=1 instead of P=2
 
 
-def run_test(test_file: str, expected: dict):
+# Serializes per-case output so concurrent tests do not interleave
+_PRINT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _server_up() -> bool:
+    """Probe the API root once per process, over the shared session."""
+    try:
+        return SESSION.get(f"{BASE_URL}/").status_code == 200
+    except requests.exceptions.ConnectionError:
+        return False
+
+
+def _flush(lines):
+    """Print one test case's buffered output as a single block."""
+    with _PRINT_LOCK:
+        print("\n".join(lines))
+
+
+def run_test(test_file: str, expected: Expected):
     """Run a single test case and validate results."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {test_file}")
-    print(f"{'='*60}")
-    
-    test_path = TEST_DIR / test_file
-    
-    if not test_path.exists():
-        print(f"ERROR: Test file not found: {test_path}")
+    out = []
+    if VERBOSE:
+        out.append(f"\n{'='*60}")
+        out.append(f"Testing: {test_file}")
+        out.append(f"{'='*60}")
+
+    payload = _PAYLOADS.get(test_file)
+    if payload is None:
+        out.append(f"ERROR: Test file not found: {TEST_DIR / test_file}")
+        _flush(out)
         return False
-    
+
+    raw, test_data = payload
+
     try:
-        # Read test file
-        with open(test_path, 'r') as f:
-            test_data = json.load(f)
-        
-        print(f"Test Input:")
-        print(json.dumps(test_data, indent=2))
-        
-        # Send request to API
-        with open(test_path, 'rb') as f:
-            files = {'file': (test_file, f, 'application/json')}
-            response = requests.post(f"{BASE_URL}/api/calculate-risk", files=files)
-        
+        if VERBOSE:
+            out.append(f"Test Input:")
+            out.append(json.dumps(test_data, indent=2))
+
+        # Send the preloaded bytes to the API
+        files = {'file': (test_file, io.BytesIO(raw), 'application/json')}
+        response = SESSION.post(f"{BASE_URL}/api/calculate-risk", files=files)
+
         if response.status_code != 200:
-            print(f"ERROR: API returned status {response.status_code}")
-            print(f"Response: {response.text}")
+            out.append(f"ERROR: API returned status {response.status_code}")
+            out.append(f"Response: {response.text}")
+            _flush(out)
             return False
-        
+
         result = response.json()
-        
-        print(f"\nActual Result:")
-        print(json.dumps(result, indent=2))
-        
-        print(f"\nExpected:")
-        print(f"  Agency: {expected['agency']}")
-        print(f"  Autonomy: {expected['autonomy']}")
-        print(f"  Persistence: {expected['persistence']}")
-        print(f"  Tier: {expected['tier']}")
-        print(f"  Score Range: {expected['score_range']}")
-        
-        # Validate results
-        passed = True
+
+        if VERBOSE:
+            out.append(f"\nActual Result:")
+            out.append(json.dumps(result, indent=2))
+
+            out.append(f"\nExpected:")
+            out.append(f"  Agency: {expected.agency}")
+            out.append(f"  Autonomy: {expected.autonomy}")
+            out.append(f"  Persistence: {expected.persistence}")
+            out.append(f"  Tier: {expected.tier}")
+            out.append(f"  Score Range: {expected.score_range}")
+
+        # Validate results: one tuple compare on the happy path; fields
+        # are only enumerated when something mismatched
+        field_names = ('agency', 'autonomy', 'persistence', 'tier')
+        actual = tuple(result.get(name) for name in field_names)
+        expected_values = (expected.agency, expected.autonomy, expected.persistence, expected.tier)
+
         errors = []
-        
-        if result.get('agency') != expected['agency']:
-            errors.append(f"Agency mismatch: expected {expected['agency']}, got {result.get('agency')}")
-            passed = False
-        
-        if result.get('autonomy') != expected['autonomy']:
-            errors.append(f"Autonomy mismatch: expected {expected['autonomy']}, got {result.get('autonomy')}")
-            passed = False
-        
-        if result.get('persistence') != expected['persistence']:
-            errors.append(f"Persistence mismatch: expected {expected['persistence']}, got {result.get('persistence')}")
-            passed = False
-        
-        if result.get('tier') != expected['tier']:
-            errors.append(f"Tier mismatch: expected {expected['tier']}, got {result.get('tier')}")
-            passed = False
-        
+        if actual != expected_values:
+            for name, got, want in zip(field_names, actual, expected_values):
+                if got != want:
+                    errors.append(f"{name.capitalize()} mismatch: expected {want}, got {got}")
+
         score = result.get('score', 0)
-        min_score, max_score = expected['score_range']
+        min_score, max_score = expected.score_range
         if not (min_score <= score < max_score):
             errors.append(f"Score out of range: expected {min_score} ≤ score < {max_score}, got {score}")
-            passed = False
-        
-        if errors:
-            print(f"\n❌ TEST FAILED")
-            for error in errors:
-                print(f"  - {error}")
+
+        passed = not errors
+
+        if VERBOSE:
+            out.append(f"\n❌ TEST FAILED" if errors else f"\n✅ TEST PASSED")
         else:
-            print(f"\n✅ TEST PASSED")
-        
+            status = "❌" if errors else "✅"
+            out.append(f"{status} {test_file}: tier={result.get('tier')} score={result.get('score')}")
+        for error in errors:
+            out.append(f"  - {error}")
+
+        _flush(out)
         return passed
-        
+
+    except requests.exceptions.ConnectionError:
+        out.append(f"ERROR: Cannot connect to server at {BASE_URL}")
+        if not _server_up():
+            out.append("Please start the backend server first:")
+            out.append("  cd backend && uvicorn main:app --reload --port 8000")
+        _flush(out)
+        return False
+
     except Exception as e:
-        print(f"ERROR: {str(e)}")
+        out.append(f"ERROR: {str(e)}")
+        _flush(out)
         import traceback
         traceback.print_exc()
         return False
 
 
+@pytest.mark.parametrize(
+    "test_file,expected",
+    EXPECTED_RESULTS,
+    ids=[name for name, _ in EXPECTED_RESULTS],
+)
+def test_case(test_file, expected):
+    """
+    Pytest entry point for one test case. Run `pytest tests/ -n auto`
+    (pytest-xdist) to shard cases across workers; each worker imports
+    its own copy of the module and therefore gets its own pooled
+    session.
+    """
+    assert run_test(test_file, expected), f"{test_file} failed validation"
+
+
 def main():
     """Run all test cases."""
     print("ABOM Risk Scoring Engine - Test Suite")
@@ -161,24 +220,24 @@ def main():
     print(f"Testing against: {BASE_URL}")
     print(f"Test directory: {TEST_DIR}")
     
-    # Check if server is running
-    try:
-        response = requests.get(f"{BASE_URL}/")
-        if response.status_code != 200:
-            print(f"\nERROR: Server not responding at {BASE_URL}")
-            print("Please start the backend server first:")
-            print("  cd backend && uvicorn main:app --reload --port 8000")
-            return
-    except requests.exceptions.ConnectionError:
-        print(f"\nERROR: Cannot connect to server at {BASE_URL}")
-        print("Please start the backend server first:")
-        print("  cd backend && uvicorn main:app --reload --port 8000")
-        return
-    
-    # Run all tests
-    results = {}
-    for test_file, expected in EXPECTED_RESULTS.items():
-        results[test_file] = run_test(test_file, expected)
+    # No up-front health probe: it costs a round-trip on every run and
+    # the server state is checked lazily (cached) if a request fails
+
+    # Fire all cases concurrently over the shared session; requests
+    # releases the GIL during socket I/O, so wall time is roughly the
+    # slowest round-trip instead of the sum of all of them
+    unordered = {}
+    with SESSION:
+        with ThreadPoolExecutor(max_workers=min(8, len(EXPECTED_RESULTS))) as executor:
+            futures = {
+                executor.submit(run_test, test_file, expected): test_file
+                for test_file, expected in EXPECTED_RESULTS
+            }
+            for future in as_completed(futures):
+                unordered[futures[future]] = future.result()
+
+    # Keep the summary in declaration order regardless of completion order
+    results = {test_file: unordered[test_file] for test_file, _ in EXPECTED_RESULTS}
     
     # Summary
     print(f"\n{'='*60}")